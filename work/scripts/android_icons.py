@@ -5,9 +5,20 @@ This script uses PIL to copy work/gfx/app-icon.png to
 android/app/src/main/res/mipmap-*
 """
 
+import argparse
 import os
+import shutil
 from PIL import Image
 
+parser = argparse.ArgumentParser(description="Create the Android launcher icons.")
+parser.add_argument(
+    "--force",
+    action="store_true",
+    help="recreate the icons even if they are newer than the logo",
+)
+
+args = parser.parse_args()
+
 #  Sizes
 icon_sizes = {
     "mipmap-hdpi": 72,
@@ -17,6 +28,21 @@ icon_sizes = {
     "mipmap-xxxhdpi": 192,
 }
 
+# Launcher icons created in every mipmap folder
+launcher_names = ("ic_launcher.png", "ic_launcher_fore.png", "ic_launcher_back.png")
+
+
+def _needs_rebuild(src, dst):
+    return not os.path.exists(dst) or os.path.getmtime(src) > os.path.getmtime(dst)
+
+
+def _density_needs_rebuild(name):
+    return args.force or any(
+        _needs_rebuild(logo_path, os.path.join(assets_path, name, fname))
+        for fname in launcher_names
+    )
+
+
 # Get the path of the logo
 logo_path = os.path.join(os.getcwd(), "work", "gfx", "app-icon.png")
 
@@ -26,21 +52,34 @@ android_path = os.path.join(os.getcwd(), "android")
 # Get the path of the Assets.xcassets folder
 assets_path = os.path.join(android_path, "app", "src", "main", "res")
 
-# Load the logo
-logo = Image.open(logo_path)
+# Nothing to do if all the icons are newer than the logo
+if not any(_density_needs_rebuild(name) for name in icon_sizes):
+    print("Icons are up to date")
+    exit(0)
 
-# Cycle through the iOS sizes
-for name, siz in icon_sizes.items():
+# Load the logo and convert it to RGB only once
+logo = Image.open(logo_path).convert("RGB")
+
+# Resize the full source only once, to 4 times the biggest icon, and
+# resize every icon from that. Chaining through near-equal sizes
+# (192 -> 144) would soften the small icons.
+sizes_sorted = sorted(icon_sizes.items(), key=lambda kv: -kv[1])
+
+base_size = min(4 * sizes_sorted[0][1], logo.width)
+base = logo.resize((base_size, base_size), Image.LANCZOS)
+
+# Cycle through the Android sizes
+for name, siz in sizes_sorted:
     # Calculate the new size of the logo based on the width of the splash.png
     size = ( siz, siz )
 
+    if not _density_needs_rebuild(name):
+        continue
+
     print("Creating:", size)
 
     # Resize the logo
-    resized_logo = logo.resize(size)
-
-    # Convert the logo to RGB
-    resized_logo = resized_logo.convert("RGB")
+    current = base.resize(size, Image.LANCZOS)
 
     # Create the path of the splash.png file
     splash_path = os.path.join(
@@ -50,22 +89,20 @@ for name, siz in icon_sizes.items():
     )
 
     # Save the resized logo
-    resized_logo.save(splash_path)
-
-    # Save as foreground
-    resized_logo.save(
-        os.path.join(
-            assets_path,
-            name,
-            "ic_launcher_fore.png"
-        )
-    )
+    current.save(splash_path, optimize=False, compress_level=1)
+
+    # Foreground and background are the same image: hardlink the PNG
+    # we just saved instead of encoding it again
+    for extra in launcher_names[1:]:
+        dst = os.path.join(assets_path, name, extra)
+
+        try:
+            os.unlink(dst)
+        except FileNotFoundError:
+            pass
 
-    # Save as background
-    resized_logo.save(
-        os.path.join(
-            assets_path,
-            name,
-            "ic_launcher_back.png"
-        )
-    )
\ No newline at end of file
+        try:
+            os.link(splash_path, dst)
+        except OSError:
+            # The filesystem does not support hardlinks
+            shutil.copyfile(splash_path, dst)
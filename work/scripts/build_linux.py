@@ -4,8 +4,8 @@
 This script builds the Windows executable for the Woxxy app, reading the APP_VERSION from the lib/config/version.dart file.
 This scripts runs the following commands to build the Windows executable:
 
-- flutter clean
-- flutter pub get
+- flutter clean (only with --clean)
+- flutter pub get (only if pubspec.yaml is newer than pubspec.lock)
 - flutter build linux --release
 
 then it creates a tar.bz2 the release folder as 'woxxy-$APP_VERSION-linux-x64.tar.bz2' and moves it to the Desktop.
@@ -13,7 +13,10 @@ then it creates a tar.bz2 the release folder as 'woxxy-$APP_VERSION-linux-x64.ta
 This script must be run from the root of the project.
 """
 
+import argparse
 import os
+import shutil
+import subprocess
 
 APP_VERSION = None
 FINAL_ZIP = ""
@@ -36,37 +39,76 @@ def get_app_version():
     FINAL_ZIP = f"woxxy-{APP_VERSION}-linux-x64.tar.bz2"
 
 
-def build_linux():
-    os.system("flutter clean")
-    os.system("flutter pub get")
-    os.system("flutter build linux --release")
+def run(*cmd):
+    # No shell, and stop the build as soon as a command fails
+    subprocess.run([shutil.which(cmd[0]) or cmd[0], *cmd[1:]], check=True)
+
+
+def pub_get_needed():
+    # pubspec.lock is rewritten by "flutter pub get"
+    if not os.path.exists("pubspec.lock"):
+        return True
+
+    return os.path.getmtime("pubspec.yaml") > os.path.getmtime("pubspec.lock")
+
+
+def build_linux(clean=False):
+    if clean:
+        run("flutter", "clean")
+
+    if clean or pub_get_needed():
+        run("flutter", "pub", "get")
+
+    run("flutter", "build", "linux", "--release")
+
+
+def get_compress_program():
+    # Prefer a parallel bzip2 implementation, fall back to plain bzip2
+    if shutil.which("pbzip2"):
+        return f"pbzip2 -p{os.cpu_count()}"
+
+    if shutil.which("lbzip2"):
+        return f"lbzip2 -n {os.cpu_count()}"
+
+    return "bzip2"
 
 
 def zip_release_folder():
     BASE_DIR = "build/linux/x64/release/bundle"
 
-    # save the current directory
-    current_dir = os.getcwd()
-
     if not os.path.exists(BASE_DIR):
         print("Release folder not found. Please run the build_linux() function first.")
         exit(1)
 
-    os.chdir(BASE_DIR)
-
-    os.system(f"tar cvfj {current_dir}/{FINAL_ZIP} .")
-    os.chdir(current_dir)
+    # tar -C changes directory only inside tar, not in this process
+    run(
+        "tar",
+        "-c",
+        "--use-compress-program",
+        get_compress_program(),
+        "-C",
+        BASE_DIR,
+        "-f",
+        FINAL_ZIP,
+        ".",
+    )
 
 
 def move_zip_to_desktop():
-    if os.path.exists(os.path.join(os.path.expanduser("~"), "Desktop", FINAL_ZIP)):
-        os.unlink(os.path.join(os.path.expanduser("~"), "Desktop", FINAL_ZIP))
-
-    os.rename(FINAL_ZIP, os.path.join(os.path.expanduser("~"), "Desktop", FINAL_ZIP))
+    # os.replace() overwrites an existing file in a single call
+    os.replace(FINAL_ZIP, os.path.join(os.path.expanduser("~"), "Desktop", FINAL_ZIP))
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Linux release.")
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="run flutter clean before building",
+    )
+    args = parser.parse_args()
+
     get_app_version()
-    build_linux()
+    build_linux(args.clean)
     zip_release_folder()
     move_zip_to_desktop()
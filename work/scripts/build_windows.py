@@ -4,16 +4,20 @@
 This script builds the Windows executable for the Woxxy app, reading the APP_VERSION from the lib/config/version.dart file.
 This scripts runs the following commands to build the Windows executable:
 
-- flutter clean
-- flutter pub get
+- flutter clean (only with --clean)
+- flutter pub get (only if pubspec.yaml is newer than pubspec.lock)
 - flutter build windows --release
 
 then it zips the release folder as 'woxxy-$APP_VERSION-windows-x64.zip' and moves it to the Desktop.
+If 7-Zip (7z) is in the PATH it is used to compress the release folder using all the CPU cores.
 
 This script must be run from the root of the project.
 """
 
+import argparse
 import os
+import shutil
+import subprocess
 import zipfile
 
 APP_VERSION = None
@@ -37,32 +41,96 @@ def get_app_version():
     FINAL_ZIP = f"woxxy-{APP_VERSION}-windows-x64.zip"
 
 
-def build_windows():
-    os.system("flutter clean")
-    os.system("flutter pub get")
-    os.system("flutter build windows --release")
+def run(*cmd):
+    # No shell: resolve the executable (flutter is a .bat on Windows)
+    # and stop the build as soon as a command fails
+    subprocess.run([shutil.which(cmd[0]) or cmd[0], *cmd[1:]], check=True)
+
+
+def pub_get_needed():
+    # pubspec.lock is rewritten by "flutter pub get"
+    if not os.path.exists("pubspec.lock"):
+        return True
+
+    return os.path.getmtime("pubspec.yaml") > os.path.getmtime("pubspec.lock")
+
+
+def build_windows(clean=False):
+    if clean:
+        run("flutter", "clean")
+
+    if clean or pub_get_needed():
+        run("flutter", "pub", "get")
+
+    run("flutter", "build", "windows", "--release")
+
+
+def walk_files(root):
+    # os.scandir() caches the entry type, so no extra stat() per file
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    # Like os.walk(): symlinks to folders are not followed
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    yield entry.path
 
 
 def zip_release_folder():
     BASE_DIR = "build/windows/x64/runner/Release"
-    with zipfile.ZipFile(FINAL_ZIP, "w") as zipf:
-        for root, _, files in os.walk(BASE_DIR):
-            for file in files:
-                print(f"Zipping {os.path.join(root, file)}")
-                zipf.write(
-                    os.path.join(root, file),
-                    os.path.relpath(os.path.join(root, file), BASE_DIR),
-                )
+
+    # 7-Zip compresses using all the CPU cores, zipfile only uses one
+    seven_zip = shutil.which("7z")
+    if seven_zip:
+        # 7z adds to an existing archive, so start from scratch
+        if os.path.exists(FINAL_ZIP):
+            os.unlink(FINAL_ZIP)
+
+        subprocess.run(
+            [
+                seven_zip,
+                "a",
+                "-tzip",
+                "-mmt=on",
+                "-mx=5",
+                os.path.abspath(FINAL_ZIP),
+                ".",
+            ],
+            cwd=BASE_DIR,
+            check=True,
+        )
+        return
+
+    with zipfile.ZipFile(
+        FINAL_ZIP,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=6,
+        allowZip64=True,
+    ) as zipf:
+        for path in walk_files(BASE_DIR):
+            zipf.write(path, os.path.relpath(path, BASE_DIR))
 
 
 def move_zip_to_desktop():
-    os.unlink(os.path.join(os.path.expanduser("~"), "Desktop", FINAL_ZIP))
-    os.rename(FINAL_ZIP, os.path.join(os.path.expanduser("~"), "Desktop", FINAL_ZIP))
+    # os.replace() overwrites an existing file in a single call
+    os.replace(FINAL_ZIP, os.path.join(os.path.expanduser("~"), "Desktop", FINAL_ZIP))
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Windows release.")
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="run flutter clean before building",
+    )
+    args = parser.parse_args()
+
     get_app_version()
-    build_windows()
+    build_windows(args.clean)
     zip_release_folder()
     move_zip_to_desktop()
     print(
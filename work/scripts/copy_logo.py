@@ -6,9 +6,24 @@ android/app/src/main/res/drawable-* folders as splash.png
 with the correct size for each folder.
 """
 
+import argparse
 import os
 from PIL import Image
 
+parser = argparse.ArgumentParser(description="Copy the logo as splash.png.")
+parser.add_argument(
+    "--force",
+    action="store_true",
+    help="recreate the splash images even if they are newer than the logo",
+)
+
+args = parser.parse_args()
+
+
+def _needs_rebuild(src, dst):
+    return not os.path.exists(dst) or os.path.getmtime(src) > os.path.getmtime(dst)
+
+
 # Create a dictionary with the sizes of the splash.png files
 sizes = {
     "hdpi": 396,
@@ -34,32 +49,60 @@ drawable_folders = [
     if folder.startswith("drawable")
 ]
 
-# Load the logo
-logo = Image.open(logo_path)
-
-# Get original size of the logo
-original_size = logo.size
+# Collect the splash.png files to create with their width
+splashes = []
 
-# Cycle through the drawable folders
 for drawable_folder in drawable_folders:
     bname = os.path.basename(drawable_folder)
     if bname.find("-") == -1:
         continue
 
-    # Get the path of the splash.png file
-    splash_path = os.path.join(drawable_folder, "splash.png")
-
     # Get the size of the splash.png file
     width = sizes.get(bname.split("-")[1])
 
     if not width:
         continue
 
-    # Calculate the new size of the logo based on the width of the splash.png
-    size = (width, int(width * original_size[1] / original_size[0]))
+    # Get the path of the splash.png file
+    splash_path = os.path.join(drawable_folder, "splash.png")
+
+    splashes.append((width, splash_path))
+
+# Nothing to do if all the splash.png files are newer than the logo
+if not args.force and not any(
+    _needs_rebuild(logo_path, splash_path) for _, splash_path in splashes
+):
+    print("Splash images are up to date")
+    exit(0)
+
+# Load the logo
+logo = Image.open(logo_path)
+
+# Get original size of the logo
+original_size = logo.size
 
-    # Resize the logo
-    resized_logo = logo.resize(size)
+# Sort from the biggest to the smallest, so every resize starts
+# from the previous (bigger) result instead of the full logo
+splashes.sort(key=lambda s: -s[0])
+
+# thumbnail() resizes in place and keeps the aspect ratio, so the
+# logo itself is shrunk step by step
+current = logo
+
+# Cycle through the splash.png files
+for width, splash_path in splashes:
+    # Resize the logo to the width of the splash.png
+    # (always, the next sizes start from this one)
+    if current.width >= width:
+        current.thumbnail((width, 10**9), Image.LANCZOS)
+    else:
+        # thumbnail() never upscales: the logo is narrower than the splash.png
+        size = (width, int(width * original_size[1] / original_size[0]))
+        current = current.resize(size, Image.LANCZOS)
+
+    # Skip if splash.png is newer than the logo
+    if not args.force and not _needs_rebuild(logo_path, splash_path):
+        continue
 
     # Save the resized logo as splash.png
-    resized_logo.save(splash_path)
+    current.save(splash_path, optimize=False, compress_level=1)
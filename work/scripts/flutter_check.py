@@ -10,7 +10,10 @@ and verifies if everything is correct.
 
 import argparse
 import json
+import mmap
 import os
+import re
+from contextlib import contextmanager
 
 # Create the arg parser. We take in input:
 # - the path to the JSON file with the app info
@@ -46,25 +49,52 @@ parser.add_argument(
 args = parser.parse_args()
 
 
+def first_match(path, regex):
+    # Return the match for the first matching line, without reading the whole file
+    with open(path) as f:
+        for line in f:
+            m = regex.search(line)
+            if m:
+                return m
+
+    return None
+
+
+@contextmanager
+def map_file(path):
+    # Map the file instead of reading it into a string: every check
+    # below just searches the same mapping with find().
+    # An empty file cannot be mapped, so it is searched as b"".
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def contains(mm, text):
+    return mm.find(text.encode()) >= 0
+
+
 # Check that version.dart and pubspec.yaml have the same version number
 
+APP_VERSION_RE = re.compile(r"APP_VERSION[^'\"]*['\"]([^'\"]*)['\"]")
+PUBSPEC_VERSION_RE = re.compile(r"^version:(.*)")
+
 VERSION_DART = ""
 VERSION_PUBSPEC = ""
 
 # Read the version number from version.dart
-for line in open("lib/config/version.dart").readlines():
-    if "APP_VERSION" in line:
-        if "'" in line:
-            VERSION_DART = line.split("'")[1]
-        elif '"' in line:
-            VERSION_DART = line.split('"')[1]
-        break
+m = first_match("lib/config/version.dart", APP_VERSION_RE)
+if m:
+    VERSION_DART = m.group(1)
 
 # Read the version number from pubspec.yaml
-for line in open("pubspec.yaml").readlines():
-    if line.startswith("version:"):
-        VERSION_PUBSPEC = line.split(":")[1].strip()
-        break
+m = first_match("pubspec.yaml", PUBSPEC_VERSION_RE)
+if m:
+    VERSION_PUBSPEC = m.group(1).strip()
 
 if VERSION_DART != VERSION_PUBSPEC:
     print("Error: version number in version.dart and pubspec.yaml are different")
@@ -75,92 +105,88 @@ if VERSION_DART != VERSION_PUBSPEC:
 
 # Read the JSON file
 
-app_info = json.load(open(args.app_info))
+with open(args.app_info) as f:
+    app_info = json.load(f)
 
 # Check the app name in AndroidManifest.xml
 
 if not args.skip_android:
-    android_manifest = open("android/app/src/main/AndroidManifest.xml").read()
-    if app_info["name"] not in android_manifest:
-        print("Error: app name not found in main / AndroidManifest.xml (android:label)")
-        print("       check: android/app/src/main/AndroidManifest.xml")
-        exit(1)
-
-    android_debug_manifest = open("android/app/src/debug/AndroidManifest.xml").read()
-    if app_info["name"] not in android_manifest:
-        print(
-            "Error: app name not found in debug / AndroidManifest.xml (android:label)"
-        )
-        print("       check: android/app/src/debug/AndroidManifest.xml")
-        exit(1)
-
-    # Check the package name in AndroidManifest.xml
+    with map_file("android/app/src/main/AndroidManifest.xml") as android_manifest:
+        if not contains(android_manifest, app_info["name"]):
+            print(
+                "Error: app name not found in main / AndroidManifest.xml (android:label)"
+            )
+            print("       check: android/app/src/main/AndroidManifest.xml")
+            exit(1)
 
-    if app_info["package"] not in android_manifest:
-        print("Error: package name not found in main / AndroidManifest.xml (package)")
-        print("       check: android/app/src/main/AndroidManifest.xml")
-        exit(1)
+        # Check the package name in AndroidManifest.xml
 
-    if app_info["package"] not in android_debug_manifest:
-        print("Error: package name not found in debug / AndroidManifest.xml (package)")
-        print("       check: android/app/src/debug/AndroidManifest.xml")
-        exit(1)
+        if not contains(android_manifest, app_info["package"]):
+            print(
+                "Error: package name not found in main / AndroidManifest.xml (package)"
+            )
+            print("       check: android/app/src/main/AndroidManifest.xml")
+            exit(1)
 
-    if not args.skip_kotlin:
-        # Now check if the package name is reflected in the folder structure
-        # Get the directory tree of the android folder
+    with map_file(
+        "android/app/src/debug/AndroidManifest.xml"
+    ) as android_debug_manifest:
+        if not contains(android_debug_manifest, app_info["name"]):
+            print(
+                "Error: app name not found in debug / AndroidManifest.xml (android:label)"
+            )
+            print("       check: android/app/src/debug/AndroidManifest.xml")
+            exit(1)
 
-        android_dir_tree = os.walk("android/app/src/main/kotlin/")
+        if not contains(android_debug_manifest, app_info["package"]):
+            print(
+                "Error: package name not found in debug / AndroidManifest.xml (package)"
+            )
+            print("       check: android/app/src/debug/AndroidManifest.xml")
+            exit(1)
 
-        split_package = app_info["package"].split(".")
+    if not args.skip_kotlin:
+        # Check if the package name is reflected in the folder structure:
+        # stat the expected package folder directly instead of walking
+        # the whole kotlin tree
 
-        # Check if the package name is reflected in the folder structure
-        # We check if the package name is in the folder structure
-        # and if the folder structure is the same as the package name
+        dname = "android/app/src/main/kotlin/%s" % app_info["package"].replace(".", "/")
 
-        for root, dirs, files in android_dir_tree:
-            for dir in dirs:
-                if dir not in split_package:
-                    print(
-                        f"Error: package name not found in folder structure (android/app/src/main/kotlin/{dir})"
-                    )
-                    exit(1)
+        if not os.path.isdir(dname):
+            print(f"Error: package name not found in folder structure ({dname})")
+            exit(1)
 
         # Check if MainActivity.kt is in the correct folder
 
-        if "MainActivity.kt" not in files:
-            print("Error: MainActivity.kt not found in android/app/src/main/kotlin/")
+        if not os.path.isfile(os.path.join(dname, "MainActivity.kt")):
+            print(f"Error: MainActivity.kt not found in {dname}")
             exit(1)
 
         # Check if MainActivity.kt contains the correct package name
 
-        dname = "android/app/src/main/kotlin/%s" % app_info["package"].replace(".", "/")
-
-        main_activity = open("%s/MainActivity.kt" % dname).read()
-
-        if app_info["package"] not in main_activity:
-            print(
-                "Error: package name not found in MainActivity.kt (package %s)"
-                % app_info["package"]
-            )
-            exit(1)
-
-        # Check if MainActivity.kt contains FlutterFragmentActivity
-        if "FlutterFragmentActivity" not in main_activity:
-            print("Error: FlutterFragmentActivity not found in MainActivity.kt")
-            print(
-                "       check: android/app/src/main/kotlin/%s/MainActivity.kt" % dname
-            )
-            exit(1)
+        with map_file("%s/MainActivity.kt" % dname) as main_activity:
+            if not contains(main_activity, app_info["package"]):
+                print(
+                    "Error: package name not found in MainActivity.kt (package %s)"
+                    % app_info["package"]
+                )
+                exit(1)
+
+            # Check if MainActivity.kt contains FlutterFragmentActivity
+            if not contains(main_activity, "FlutterFragmentActivity"):
+                print("Error: FlutterFragmentActivity not found in MainActivity.kt")
+                print(
+                    "       check: android/app/src/main/kotlin/%s/MainActivity.kt" % dname
+                )
+                exit(1)
 
     # Check if build.gradle contains the keystoreProperties directives
 
-    build_gradle = open("android/app/build.gradle").read()
-
-    if "keystoreProperties" not in build_gradle:
-        print("Error: keystoreProperties not found in android/app/build.gradle")
-        print(
-            """
+    with map_file("android/app/build.gradle") as build_gradle:
+        if not contains(build_gradle, "keystoreProperties"):
+            print("Error: keystoreProperties not found in android/app/build.gradle")
+            print(
+                """
     Open android/app/build.gradle and add the following lines before the android { ... } block:
 
     def keystoreProperties = new Properties()
@@ -169,38 +195,38 @@ if not args.skip_android:
         keystoreProperties.load(new FileInputStream(keystorePropertiesFile))
     }
     """
-        )
-        exit(1)
+            )
+            exit(1)
 
-    if "flutter.versionCode" in build_gradle:
-        print("Error: flutter.versionCode should be changed to a valid version number")
-        print(
-            "       change: `versionCode flutter.versionCode` to `versionCode 1` in android/app/build.gradle"
-        )
-        exit(1)
-
-    # Check if versionCode is a real number
-    # Use grep and sed to extract the versionCode from build.gradle
-    vscode = os.system(
-        "grep 'versionCode [0-9]' android/app/build.gradle | sed -E 's/.*versionCode ([0-9]+).*/\\1/'"
-    )
-    # if vcode is empty, then the versionCode is not a number
-    if vscode == "":
-        print("Error: versionCode must be a real number in android/app/build.gradle")
-        print(
-            "       check: android/app/build.gradle  - change versionCode to a real number"
-        )
-        print(
-            "       example: versionCode 1 (be sure to remove the flutter.versionCode and not use any = !!!"
+        if contains(build_gradle, "flutter.versionCode"):
+            print("Error: flutter.versionCode should be changed to a valid version number")
+            print(
+                "       change: `versionCode flutter.versionCode` to `versionCode 1` in android/app/build.gradle"
+            )
+            exit(1)
+
+        # Check if versionCode is a real number
+        # Use grep and sed to extract the versionCode from build.gradle
+        vscode = os.system(
+            "grep 'versionCode [0-9]' android/app/build.gradle | sed -E 's/.*versionCode ([0-9]+).*/\\1/'"
         )
-        exit(1)
+        # if vcode is empty, then the versionCode is not a number
+        if vscode == "":
+            print("Error: versionCode must be a real number in android/app/build.gradle")
+            print(
+                "       check: android/app/build.gradle  - change versionCode to a real number"
+            )
+            print(
+                "       example: versionCode 1 (be sure to remove the flutter.versionCode and not use any = !!!"
+            )
+            exit(1)
 
-    # check if build.gradle contains the signingConfigs directives
+        # check if build.gradle contains the signingConfigs directives
 
-    if "signingConfigs {" not in build_gradle:
-        print("Error: signingConfigs not found in android/app/build.gradle")
-        print(
-            """
+        if not contains(build_gradle, "signingConfigs {"):
+            print("Error: signingConfigs not found in android/app/build.gradle")
+            print(
+                """
     Open android/app/build.gradle and add the following lines inside the android { ... } block,
     DELETE buildTypes { ... } block and replace everything with:
 
@@ -220,47 +246,46 @@ if not args.skip_android:
         }
 
     """
-        )
-        exit(1)
+            )
+            exit(1)
 
-    # Check if build.gradle contains the correct applicationId
+        # Check if build.gradle contains the correct applicationId
 
-    if app_info["package"] not in build_gradle:
-        print(
-            "Error: package name not found in android/app/build.gradle (applicationId %s)"
-            % app_info["package"]
-        )
-        exit(1)
+        if not contains(build_gradle, app_info["package"]):
+            print(
+                "Error: package name not found in android/app/build.gradle (applicationId %s)"
+                % app_info["package"]
+            )
+            exit(1)
 
-    # Check if build.gradle has a real number in versionCode
-    if "flutterVersionCode.toInteger()" in build_gradle:
-        print("Error: versionCode must be a real number in android/app/build.gradle")
-        print(
-            "       check: android/app/build.gradle  - change flutterVersionCode.toInteger() to a real number"
-        )
-        exit(1)
+        # Check if build.gradle has a real number in versionCode
+        if contains(build_gradle, "flutterVersionCode.toInteger()"):
+            print("Error: versionCode must be a real number in android/app/build.gradle")
+            print(
+                "       check: android/app/build.gradle  - change flutterVersionCode.toInteger() to a real number"
+            )
+            exit(1)
 
 
 if not args.skip_ios:
     # Check the app name in Info.plist
-    info_plist = open("ios/Runner/Info.plist").read()
-    if app_info["name"] not in info_plist:
-        print(
-            "Error: app name not found in Info.plist (CFBundleDisplayName / CFBundleName)"
-        )
-        print("       check: ios/Runner/Info.plist")
-        exit(1)
+    with map_file("ios/Runner/Info.plist") as info_plist:
+        if not contains(info_plist, app_info["name"]):
+            print(
+                "Error: app name not found in Info.plist (CFBundleDisplayName / CFBundleName)"
+            )
+            print("       check: ios/Runner/Info.plist")
+            exit(1)
 
     # Check the app name also in ios/Runner.xcodeproj/project.pbxproj
 
     # We check using the ios-package key
     pname = app_info.get("ios-package", app_info["package"])
 
-    project_pbxproj = open("ios/Runner.xcodeproj/project.pbxproj").read()
-
-    if pname not in project_pbxproj:
-        print(
-            "Error: app name '%s' not found in ios/Runner.xcodeproj/project.pbxproj (PRODUCT_NAME and PRODUCT_BUNDLE_IDENTIFIER)"
-            % pname
-        )
-        exit(1)
+    with map_file("ios/Runner.xcodeproj/project.pbxproj") as project_pbxproj:
+        if not contains(project_pbxproj, pname):
+            print(
+                "Error: app name '%s' not found in ios/Runner.xcodeproj/project.pbxproj (PRODUCT_NAME and PRODUCT_BUNDLE_IDENTIFIER)"
+                % pname
+            )
+            exit(1)
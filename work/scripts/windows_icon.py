@@ -1,8 +1,13 @@
 from PIL import Image
+import argparse
 import os
 
 
-def create_ico():
+def _needs_rebuild(src, dst):
+    return not os.path.exists(dst) or os.path.getmtime(src) > os.path.getmtime(dst)
+
+
+def create_ico(force=False):
     # Get the path to the assets folder
     script_dir = os.path.dirname(os.path.abspath(__file__))
     root_dir = os.path.dirname(os.path.dirname(script_dir))
@@ -14,18 +19,54 @@ def create_ico():
         print(f"Error: {png_path} not found")
         return
 
+    ico_path = os.path.join(assets_path, "head.ico")
+    if not force and not _needs_rebuild(png_path, ico_path):
+        print(f"ICO file is up to date: {ico_path}")
+        return
+
     img = Image.open(png_path)
 
     # Convert to RGBA if not already
     img = img.convert("RGBA")
 
     # Create ICO file with multiple sizes
-    icon_sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
+    icon_sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
 
-    ico_path = os.path.join(assets_path, "head.ico")
-    img.save(ico_path, format="ICO", sizes=icon_sizes)
+    # Never upscale, like the ICO plugin does
+    icon_sizes = [s for s in icon_sizes if s[0] <= img.width and s[1] <= img.height]
+
+    if not icon_sizes:
+        print(f"Error: {png_path} is smaller than 16x16 pixels")
+        return
+
+    # Resize the 256px frame from the source, and every smaller frame from
+    # that one: the source is resampled only once instead of once per size.
+    # thumbnail() keeps the aspect ratio, like the ICO plugin does.
+    base = img.copy()
+    base.thumbnail(icon_sizes[0], Image.LANCZOS, reducing_gap=None)
+
+    frames = [base]
+    for size in icon_sizes[1:]:
+        frame = base.copy()
+        frame.thumbnail(size, Image.LANCZOS, reducing_gap=None)
+        frames.append(frame)
+
+    base.save(
+        ico_path,
+        format="ICO",
+        sizes=[frame.size for frame in frames],
+        append_images=frames[1:],
+    )
     print(f"Created ICO file at: {ico_path}")
 
 
 if __name__ == "__main__":
-    create_ico()
+    parser = argparse.ArgumentParser(description="Create the Windows ICO file.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="recreate the ICO file even if it is newer than the PNG",
+    )
+    args = parser.parse_args()
+
+    create_ico(args.force)